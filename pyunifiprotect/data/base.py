@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime, timedelta
 from functools import cache
 from ipaddress import IPv4Address
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, Optional, TypeVar, Union
 from uuid import UUID
 
 from pydantic.v1 import BaseModel
-from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, PrivateAttr
+from pydantic.v1.fields import SHAPE_DICT, SHAPE_LIST, ModelField, PrivateAttr
 
 from pyunifiprotect.data.types import (
     ModelType,
@@ -32,6 +32,7 @@ from pyunifiprotect.utils import (
     convert_unifi_data,
     dict_diff,
     is_debug,
+    is_unifi_data_convertible,
     process_datetime,
     serialize_unifi_obj,
     to_snake_case,
@@ -40,7 +41,7 @@ from pyunifiprotect.utils import (
 if TYPE_CHECKING:
     from asyncio.events import TimerHandle
 
-    from pydantic.v1.typing import DictStrAny, SetStr
+    from pydantic.v1.typing import AbstractSetIntStr, SetStr
     from typing_extensions import Self  # requires Python 3.11+
 
     from pyunifiprotect.api import ProtectApiClient
@@ -50,6 +51,8 @@ if TYPE_CHECKING:
 
 
 ProtectObject = TypeVar("ProtectObject", bound="ProtectBaseObject")
+# (pydantic field, child UFP object class if the field holds UFP objects, needs `convert_unifi_data`)
+FieldConversion = tuple[ModelField, Optional[type["ProtectBaseObject"]], bool]
 RECENT_EVENT_MAX = timedelta(seconds=30)
 EVENT_PING_INTERVAL = timedelta(seconds=3)
 _LOGGER = logging.getLogger(__name__)
@@ -71,13 +74,21 @@ class ProtectBaseObject(BaseModel):
 
     _api: Optional[ProtectApiClient] = PrivateAttr(None)
 
-    _protect_objs: ClassVar[Optional[dict[str, type[ProtectBaseObject]]]] = None
-    _protect_objs_set: ClassVar[Optional[SetStr]] = None
-    _protect_lists: ClassVar[Optional[dict[str, type[ProtectBaseObject]]]] = None
-    _protect_lists_set: ClassVar[Optional[SetStr]] = None
-    _protect_dicts: ClassVar[Optional[dict[str, type[ProtectBaseObject]]]] = None
-    _protect_dicts_set: ClassVar[Optional[SetStr]] = None
-    _to_unifi_remaps: ClassVar[Optional[DictStrAny]] = None
+    # populated for every subclass by `._set_protect_subtypes()`
+    _protect_objs: ClassVar[dict[str, type[ProtectBaseObject]]] = {}
+    _protect_objs_set: ClassVar[SetStr] = set()
+    _protect_lists: ClassVar[dict[str, type[ProtectBaseObject]]] = {}
+    _protect_lists_set: ClassVar[SetStr] = set()
+    _protect_dicts: ClassVar[dict[str, type[ProtectBaseObject]]] = {}
+    _protect_dicts_set: ClassVar[SetStr] = set()
+    _protect_children_keys: ClassVar[frozenset[str]] = frozenset()
+    _has_protect_children: ClassVar[bool] = False
+    _conversion_plan: ClassVar[dict[str, FieldConversion]] = {}
+    # populated for every subclass by `._set_unifi_remaps()`
+    _unifi_remaps: ClassVar[dict[str, str]] = {}
+    _to_unifi_remaps: ClassVar[dict[str, str]] = {}
+    # UFP JSON keys to drop from `.unifi_dict` if they are `None`, merged with parent classes
+    _prune_if_none: ClassVar[tuple[str, ...]] = ()
 
     class Config:
         arbitrary_types_allowed = True
@@ -90,7 +101,19 @@ class ProtectBaseObject(BaseModel):
         Use the static method `.from_unifi_dict()` to create objects from UFP JSON data from then the main class constructor.
         """
         super().__init__(**data)
-        self._api = api
+        self._inject_api(api)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._set_protect_subtypes()
+        cls._set_unifi_remaps()
+        cls._prune_if_none = tuple(
+            dict.fromkeys(
+                key
+                for klass in reversed(cls.__mro__)
+                for key in klass.__dict__.get("_prune_if_none", ())
+            ),
+        )
 
     @classmethod
     def from_unifi_dict(
@@ -111,40 +134,45 @@ class ProtectBaseObject(BaseModel):
         (cameras, users, etc.)
         """
 
-        data["api"] = api
-        data = cls.unifi_dict_to_dict(data)
+        data = cls.unifi_dict_to_dict(data, api=api)
 
         if is_debug():
-            data.pop("api", None)
             return cls(api=api, **data)
 
-        return cls.construct(**data)
+        return cls.construct(api=api, **data)
 
     @classmethod
-    def construct(cls, _fields_set: Optional[set[str]] = None, **values: Any) -> Self:
-        api = values.pop("api", None)
-        values_set = set(values)
-
-        unifi_objs = cls._get_protect_objs()
-        for key in cls._get_protect_objs_set().intersection(values_set):
-            if isinstance(values[key], dict):
-                values[key] = unifi_objs[key].construct(**values[key])
-
-        unifi_lists = cls._get_protect_lists()
-        for key in cls._get_protect_lists_set().intersection(values_set):
-            if isinstance(values[key], list):
-                values[key] = [
-                    unifi_lists[key].construct(**v) if isinstance(v, dict) else v
-                    for v in values[key]
-                ]
-
-        unifi_dicts = cls._get_protect_dicts()
-        for key in cls._get_protect_dicts_set().intersection(values_set):
-            if isinstance(values[key], dict):
-                values[key] = {
-                    k: unifi_dicts[key].construct(**v) if isinstance(v, dict) else v
-                    for k, v in values[key].items()
-                }
+    def construct(
+        cls,
+        _fields_set: Optional[set[str]] = None,
+        api: Optional[ProtectApiClient] = None,
+        **values: Any,
+    ) -> Self:
+        if cls._has_protect_children:
+            values_set = set(values)
+
+            unifi_objs = cls._protect_objs
+            for key in cls._protect_objs_set.intersection(values_set):
+                if isinstance(values[key], dict):
+                    values[key] = unifi_objs[key].construct(api=api, **values[key])
+
+            unifi_lists = cls._protect_lists
+            for key in cls._protect_lists_set.intersection(values_set):
+                if isinstance(values[key], list):
+                    klass = unifi_lists[key]
+                    values[key] = [
+                        klass.construct(api=api, **v) if isinstance(v, dict) else v
+                        for v in values[key]
+                    ]
+
+            unifi_dicts = cls._protect_dicts
+            for key in cls._protect_dicts_set.intersection(values_set):
+                if isinstance(values[key], dict):
+                    klass = unifi_dicts[key]
+                    values[key] = {
+                        k: klass.construct(api=api, **v) if isinstance(v, dict) else v
+                        for k, v in values[key].items()
+                    }
 
         obj = super().construct(_fields_set=_fields_set, **values)
         obj._api = api
@@ -174,94 +202,66 @@ class ProtectBaseObject(BaseModel):
         return {}
 
     @classmethod
-    def _get_to_unifi_remaps(cls) -> dict[str, str]:
-        """Helper method for overriding in child classes for reversing remap UFP
-        JSON keys to Python ones that do not fit the simple camel case to
-        snake case formula.
+    def _set_unifi_remaps(cls) -> None:
+        """Helper method to resolve `._get_unifi_remaps()` and its reverse once per class
 
-        Return format is
+        Reverse format is
         {
             "python_name": "ufpJsonName"
         }
         """
 
-        if cls._to_unifi_remaps is None:
-            cls._to_unifi_remaps = {
-                to_key: from_key for from_key, to_key in cls._get_unifi_remaps().items()
-            }
-
-        return cls._to_unifi_remaps
+        cls._unifi_remaps = cls._get_unifi_remaps()
+        cls._to_unifi_remaps = {
+            to_key: from_key for from_key, to_key in cls._unifi_remaps.items()
+        }
 
     @classmethod
     def _set_protect_subtypes(cls) -> None:
-        """Helper method to detect attrs of current class that are UFP Objects themselves"""
+        """Helper method to detect attrs of current class that are UFP Objects themselves
 
-        cls._protect_objs = {}
-        cls._protect_lists = {}
-        cls._protect_dicts = {}
+        Called once for every subclass when it is created so the results are plain class attributes.
+        """
+
+        protect_objs: dict[str, type[ProtectBaseObject]] = {}
+        protect_lists: dict[str, type[ProtectBaseObject]] = {}
+        protect_dicts: dict[str, type[ProtectBaseObject]] = {}
 
         for name, field in cls.__fields__.items():
             try:
                 if _is_protect_base_object(field.type_):
                     if field.shape == SHAPE_LIST:
-                        cls._protect_lists[name] = field.type_
+                        protect_lists[name] = field.type_
                     elif field.shape == SHAPE_DICT:
-                        cls._protect_dicts[name] = field.type_
+                        protect_dicts[name] = field.type_
                     else:
-                        cls._protect_objs[name] = field.type_
+                        protect_objs[name] = field.type_
             except TypeError:
                 pass
 
-    @classmethod
-    def _get_protect_objs(cls) -> dict[str, type[ProtectBaseObject]]:
-        """Helper method to get all child UFP objects"""
-        if cls._protect_objs is not None:
-            return cls._protect_objs
-
-        cls._set_protect_subtypes()
-        return cls._protect_objs  # type: ignore[return-value]
-
-    @classmethod
-    def _get_protect_objs_set(cls) -> set[str]:
-        """Helper method to get all child UFP objects"""
-        if cls._protect_objs_set is None:
-            cls._protect_objs_set = set(cls._get_protect_objs().keys())
-
-        return cls._protect_objs_set
-
-    @classmethod
-    def _get_protect_lists(cls) -> dict[str, type[ProtectBaseObject]]:
-        """Helper method to get all child of UFP objects (lists)"""
-        if cls._protect_lists is not None:
-            return cls._protect_lists
-
-        cls._set_protect_subtypes()
-        return cls._protect_lists  # type: ignore[return-value]
-
-    @classmethod
-    def _get_protect_lists_set(cls) -> set[str]:
-        """Helper method to get all child UFP objects"""
-        if cls._protect_lists_set is None:
-            cls._protect_lists_set = set(cls._get_protect_lists().keys())
-
-        return cls._protect_lists_set
-
-    @classmethod
-    def _get_protect_dicts(cls) -> dict[str, type[ProtectBaseObject]]:
-        """Helper method to get all child of UFP objects (dicts)"""
-        if cls._protect_dicts is not None:
-            return cls._protect_dicts
-
-        cls._set_protect_subtypes()
-        return cls._protect_dicts  # type: ignore[return-value]
-
-    @classmethod
-    def _get_protect_dicts_set(cls) -> set[str]:
-        """Helper method to get all child UFP objects"""
-        if cls._protect_dicts_set is None:
-            cls._protect_dicts_set = set(cls._get_protect_dicts().keys())
-
-        return cls._protect_dicts_set
+        cls._protect_objs = protect_objs
+        cls._protect_objs_set = set(protect_objs)
+        cls._protect_lists = protect_lists
+        cls._protect_lists_set = set(protect_lists)
+        cls._protect_dicts = protect_dicts
+        cls._protect_dicts_set = set(protect_dicts)
+        cls._protect_children_keys = frozenset(
+            (*protect_objs, *protect_lists, *protect_dicts),
+        )
+        cls._has_protect_children = bool(cls._protect_children_keys)
+
+        # field, child UFP object class and if `convert_unifi_data` is needed for every Python
+        # field name so `.unifi_dict_to_dict` does not have to look them up for every key of
+        # every object. Child UFP objects are always rebuilt by the `_clean_protect_obj*` helpers
+        children = {**protect_objs, **protect_lists, **protect_dicts}
+        cls._conversion_plan = {
+            name: (
+                field,
+                children.get(name),
+                name not in children and is_unifi_data_convertible(field),
+            )
+            for name, field in cls.__fields__.items()
+        }
 
     @classmethod
     def _get_api(cls, api: Optional[ProtectApiClient]) -> Optional[ProtectApiClient]:
@@ -279,9 +279,7 @@ class ProtectBaseObject(BaseModel):
         api: Optional[ProtectApiClient],
     ) -> Any:
         if isinstance(data, dict):
-            if api is not None:
-                data["api"] = api
-            return klass.unifi_dict_to_dict(data=data)
+            return klass.unifi_dict_to_dict(data, api=api)
         return data
 
     @classmethod
@@ -291,9 +289,11 @@ class ProtectBaseObject(BaseModel):
         klass: type[ProtectBaseObject],
         api: Optional[ProtectApiClient],
     ) -> list[Any]:
-        for index, item in enumerate(items):
-            items[index] = cls._clean_protect_obj(item, klass, api)
-        return items
+        unifi_dict_to_dict = klass.unifi_dict_to_dict
+        return [
+            unifi_dict_to_dict(item, api=api) if isinstance(item, dict) else item
+            for item in items
+        ]
 
     @classmethod
     def _clean_protect_obj_dict(
@@ -302,72 +302,60 @@ class ProtectBaseObject(BaseModel):
         klass: type[ProtectBaseObject],
         api: Optional[ProtectApiClient],
     ) -> dict[Any, Any]:
-        for key, value in items.items():
-            items[key] = cls._clean_protect_obj(value, klass, api)
-        return items
+        unifi_dict_to_dict = klass.unifi_dict_to_dict
+        return {
+            key: unifi_dict_to_dict(obj, api=api) if isinstance(obj, dict) else obj
+            for key, obj in items.items()
+        }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         """Takes a decoded UFP JSON dict and converts it into a Python dict
 
         * Remaps items from `._get_unifi_remaps()`
         * Converts camelCase keys to snake_case keys
-        * Injects ProtectAPIClient into any child UFP object Dicts
         * Runs `.unifi_dict_to_dict` for any child UFP objects
 
         Args:
         ----
             data: decoded UFP JSON dict
+            api: Optional reference to the ProtectAPIClient that created generated the UFP JSON
         """
 
         # get the API client instance
-        api = cls._get_api(data.get("api"))
-
-        # remap keys that will not be converted correctly by snake_case convert
-        remaps = cls._get_unifi_remaps()
-        for from_key in set(remaps).intersection(data):
-            data[remaps[from_key]] = data.pop(from_key)
+        api = cls._get_api(api)
 
-        # convert to snake_case and remove extra fields
-        for key in list(data.keys()):
-            new_key = to_snake_case(key)
-            data[new_key] = data.pop(key)
-            key = new_key  # noqa: PLW2901
+        remaps = cls._unifi_remaps
+        plan = cls._conversion_plan
 
-            if key == "api":
-                continue
+        result: dict[str, Any] = {}
+        for ufp_key, ufp_value in data.items():
+            # remap keys that will not be converted correctly by snake_case convert
+            key = to_snake_case(remaps.get(ufp_key, ufp_key))
 
-            if key not in cls.__fields__:
-                del data[key]
+            # remove extra fields
+            conversion = plan.get(key)
+            if conversion is None:
                 continue
-            data[key] = convert_unifi_data(data[key], cls.__fields__[key])
-
-        # clean child UFP objs
-        data_set = set(data)
-
-        unifi_objs = cls._get_protect_objs()
-        for key in cls._get_protect_objs_set().intersection(data_set):
-            data[key] = cls._clean_protect_obj(data[key], unifi_objs[key], api)
-
-        unifi_lists = cls._get_protect_lists()
-        for key in cls._get_protect_lists_set().intersection(data_set):
-            if isinstance(data[key], list):
-                data[key] = cls._clean_protect_obj_list(
-                    data[key],
-                    unifi_lists[key],
-                    api,
-                )
 
-        unifi_dicts = cls._get_protect_dicts()
-        for key in cls._get_protect_dicts_set().intersection(data_set):
-            if isinstance(data[key], dict):
-                data[key] = cls._clean_protect_obj_dict(
-                    data[key],
-                    unifi_dicts[key],
-                    api,
-                )
-
-        return data
+            field, klass, convert = conversion
+            value = convert_unifi_data(ufp_value, field) if convert else ufp_value
+            if klass is not None:
+                if field.shape == SHAPE_LIST:
+                    if isinstance(value, list):
+                        value = cls._clean_protect_obj_list(value, klass, api)
+                elif field.shape == SHAPE_DICT:
+                    if isinstance(value, dict):
+                        value = cls._clean_protect_obj_dict(value, klass, api)
+                else:
+                    value = cls._clean_protect_obj(value, klass, api)
+            result[key] = value
+
+        return result
 
     def _unifi_dict_protect_obj(
         self,
@@ -376,9 +364,8 @@ class ProtectBaseObject(BaseModel):
         use_obj: bool,
         klass: type[ProtectBaseObject],
     ) -> Any:
-        value: Optional[Any] = data.get(key)
-        if use_obj:
-            value = getattr(self, key)
+        # pydantic stores field values in `__dict__`, skip attribute lookup
+        value: Optional[Any] = self.__dict__.get(key) if use_obj else data.get(key)
 
         if isinstance(value, ProtectBaseObject):
             value = value.unifi_dict()
@@ -394,9 +381,7 @@ class ProtectBaseObject(BaseModel):
         use_obj: bool,
         klass: type[ProtectBaseObject],
     ) -> Any:
-        value: Optional[Any] = data.get(key)
-        if use_obj:
-            value = getattr(self, key)
+        value: Optional[Any] = self.__dict__.get(key) if use_obj else data.get(key)
 
         if not isinstance(value, list):
             return value
@@ -417,9 +402,7 @@ class ProtectBaseObject(BaseModel):
         key: str,
         use_obj: bool,
     ) -> Any:
-        value: Optional[Any] = data.get(key)
-        if use_obj:
-            value = getattr(self, key)
+        value: Optional[Any] = self.__dict__.get(key) if use_obj else data.get(key)
 
         if not isinstance(value, dict):
             return value
@@ -441,7 +424,6 @@ class ProtectBaseObject(BaseModel):
 
         * Remaps items from `._get_unifi_remaps()` in reverse
         * Converts snake_case to camelCase
-        * Automatically removes any ProtectApiClient instances that might still be in the data
         * Automatically calls `.unifi_dict()` for any UFP Python objects that are detected
 
         Args:
@@ -453,70 +435,69 @@ class ProtectBaseObject(BaseModel):
 
         use_obj = False
         if data is None:
-            excluded_fields = (
-                self._get_protect_objs_set() | self._get_protect_lists_set()
-            )
+            excluded_fields: AbstractSetIntStr = self._protect_children_keys
             if exclude is not None:
-                excluded_fields |= exclude
+                excluded_fields = excluded_fields | exclude
             data = self.dict(exclude=excluded_fields)
             use_obj = True
 
-        for key, klass in self._get_protect_objs().items():
-            if use_obj or key in data:
-                data[key] = self._unifi_dict_protect_obj(data, key, use_obj, klass)
+        protect_objs: Iterable[str] = self._protect_objs
+        protect_lists: Iterable[str] = self._protect_lists
+        protect_dicts: Iterable[str] = self._protect_dicts
+        if not use_obj:
+            # passed in data usually only has a few of the child UFP objects
+            protect_objs = self._protect_objs_set.intersection(data)
+            protect_lists = self._protect_lists_set.intersection(data)
+            protect_dicts = self._protect_dicts_set.intersection(data)
 
-        for key, klass in self._get_protect_lists().items():
-            if use_obj or key in data:
-                data[key] = self._unifi_dict_protect_obj_list(data, key, use_obj, klass)
+        for key in protect_objs:
+            klass = self._protect_objs[key]
+            data[key] = self._unifi_dict_protect_obj(data, key, use_obj, klass)
 
-        for key in self._get_protect_dicts():
-            if use_obj or key in data:
-                data[key] = self._unifi_dict_protect_obj_dict(data, key, use_obj)
+        for key in protect_lists:
+            klass = self._protect_lists[key]
+            data[key] = self._unifi_dict_protect_obj_list(data, key, use_obj, klass)
+
+        for key in protect_dicts:
+            data[key] = self._unifi_dict_protect_obj_dict(data, key, use_obj)
 
         # all child objects have been serialized correctly do not do it twice
         data: dict[str, Any] = serialize_unifi_obj(data, levels=2)
-        remaps = self._get_to_unifi_remaps()
+        remaps = self._to_unifi_remaps
         for to_key in set(data).intersection(remaps):
             data[remaps[to_key]] = data.pop(to_key)
 
-        if "api" in data:
-            del data["api"]
+        for key in self._prune_if_none:
+            if key in data and data[key] is None:
+                del data[key]
 
         return data
 
-    def _inject_api(
-        self,
-        data: dict[str, Any],
-        api: Optional[ProtectApiClient],
-    ) -> dict[str, Any]:
-        data["api"] = api
-        data_set = set(data)
+    def _inject_api(self, api: Optional[ProtectApiClient]) -> None:
+        """Sets the ProtectApiClient for the current object and all of its child UFP objects"""
+        self._api = api
+        if api is None or not self._has_protect_children:
+            return
 
-        for key in self._get_protect_objs_set().intersection(data_set):
+        for key in self._protect_objs:
             unifi_obj: Optional[Any] = getattr(self, key)
-            if unifi_obj is not None and isinstance(unifi_obj, dict):
-                unifi_obj["api"] = api
+            if isinstance(unifi_obj, ProtectBaseObject):
+                unifi_obj._inject_api(api)
 
-        for key in self._get_protect_lists_set().intersection(data_set):
-            new_items = []
-            for item in data[key]:
-                if isinstance(item, dict):
-                    item["api"] = api
-                new_items.append(item)
-            data[key] = new_items
-
-        for key in self._get_protect_dicts_set().intersection(data_set):
-            for item_key, item in data[key].items():
-                if isinstance(item, dict):
-                    item["api"] = api
-                data[key][item_key] = item
+        for key in self._protect_lists:
+            for item in getattr(self, key) or []:
+                if isinstance(item, ProtectBaseObject):
+                    item._inject_api(api)
 
-        return data
+        for key in self._protect_dicts:
+            for item in (getattr(self, key) or {}).values():
+                if isinstance(item, ProtectBaseObject):
+                    item._inject_api(api)
 
     def update_from_dict(self: ProtectObject, data: dict[str, Any]) -> ProtectObject:
         """Updates current object from a cleaned UFP JSON dict"""
         data_set = set(data)
-        for key in self._get_protect_objs_set().intersection(data_set):
+        for key in self._protect_objs_set.intersection(data_set):
             unifi_obj: Optional[Any] = getattr(self, key)
             if unifi_obj is not None and isinstance(unifi_obj, ProtectBaseObject):
                 item = data.pop(key)
@@ -524,9 +505,8 @@ class ProtectBaseObject(BaseModel):
                     item = unifi_obj.update_from_dict(item)
                 setattr(self, key, item)
 
-        data = self._inject_api(data, self._api)
-        unifi_lists = self._get_protect_lists()
-        for key in self._get_protect_lists_set().intersection(data_set):
+        unifi_lists = self._protect_lists
+        for key in self._protect_lists_set.intersection(data_set):
             if not isinstance(data[key], list):
                 continue
             klass = unifi_lists[key]
@@ -535,12 +515,9 @@ class ProtectBaseObject(BaseModel):
                 if item is not None and isinstance(item, ProtectBaseObject):
                     new_items.append(item)
                 elif isinstance(item, dict):
-                    new_items.append(klass(**item))
+                    new_items.append(klass(api=self._api, **item))
             setattr(self, key, new_items)
 
-        # Always injected above
-        del data["api"]
-
         for key in data:
             setattr(self, key, convert_unifi_data(data[key], self.__fields__[key]))
 
@@ -572,23 +549,13 @@ class ProtectModel(ProtectBaseObject):
 
     model: Optional[ModelType]
 
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("modelKey",)
+
     @classmethod
     @cache
     def _get_unifi_remaps(cls) -> dict[str, str]:
         return {**super()._get_unifi_remaps(), "modelKey": "model"}
 
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if "modelKey" in data and data["modelKey"] is None:
-            del data["modelKey"]
-
-        return data
-
 
 class ProtectModelWithId(ProtectModel):
     id: str
@@ -607,11 +574,16 @@ class ProtectModelWithId(ProtectModel):
         self._update_event = update_event or asyncio.Event()
 
     @classmethod
-    def construct(cls, _fields_set: Optional[set[str]] = None, **values: Any) -> Self:
+    def construct(
+        cls,
+        _fields_set: Optional[set[str]] = None,
+        api: Optional[ProtectApiClient] = None,
+        **values: Any,
+    ) -> Self:
         update_lock = values.pop("update_lock", None)
         update_queue = values.pop("update_queue", None)
         update_event = values.pop("update_event", None)
-        obj = super().construct(_fields_set=_fields_set, **values)
+        obj = super().construct(_fields_set=_fields_set, api=api, **values)
         obj._update_lock = update_lock or asyncio.Lock()
         obj._update_queue = update_queue or asyncio.Queue()
         obj._update_event = update_event or asyncio.Event()
@@ -835,7 +807,11 @@ class ProtectDeviceModel(ProtectModelWithId):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "lastSeen" in data:
             data["lastSeen"] = process_datetime(data, "lastSeen")
         if "upSince" in data and data["upSince"] is not None:
@@ -851,7 +827,7 @@ class ProtectDeviceModel(ProtectModelWithId):
         if "hardwareRevision" in data and data["hardwareRevision"] is not None:
             data["hardwareRevision"] = str(data["hardwareRevision"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def _event_callback_ping(self) -> None:
         _LOGGER.debug("Event ping timer started for %s", self.id)
@@ -934,6 +910,12 @@ class ProtectAdoptableDeviceModel(ProtectDeviceModel):
     # TODO:
     # bridgeCandidates
 
+    _prune_if_none: ClassVar[tuple[str, ...]] = (
+        "wiredConnectionState",
+        "wifiConnectionState",
+        "bluetoothConnectionState",
+    )
+
     @classmethod
     @cache
     def _get_read_only_fields(cls) -> set[str]:
@@ -967,30 +949,16 @@ class ProtectAdoptableDeviceModel(ProtectDeviceModel):
             return await self.api.update_device(self.model, self.id, data)
         return None
 
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if "wiredConnectionState" in data and data["wiredConnectionState"] is None:
-            del data["wiredConnectionState"]
-        if "wifiConnectionState" in data and data["wifiConnectionState"] is None:
-            del data["wifiConnectionState"]
-        if (
-            "bluetoothConnectionState" in data
-            and data["bluetoothConnectionState"] is None
-        ):
-            del data["bluetoothConnectionState"]
-        return data
-
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "lastDisconnect" in data and data["lastDisconnect"] is not None:
             data["lastDisconnect"] = process_datetime(data, "lastDisconnect")
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     @property
     def display_name(self) -> str:
@@ -7,7 +7,7 @@ from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 import logging
-from typing import Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Optional, cast
 from uuid import UUID
 
 from aiohttp.client_exceptions import ServerDisconnectedError
@@ -42,6 +42,9 @@ from pyunifiprotect.data.websocket import (
 from pyunifiprotect.exceptions import ClientError
 from pyunifiprotect.utils import utc_now
 
+if TYPE_CHECKING:
+    from pyunifiprotect.api import ProtectApiClient
+
 _LOGGER = logging.getLogger(__name__)
 
 MAX_SUPPORTED_CAMERAS = 256
@@ -194,8 +197,12 @@ class Bootstrap(ProtectBaseObject):
     _refresh_tasks: set[asyncio.Task[None]] = PrivateAttr(set())
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        api = cls._get_api(data.get("api"))
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
+        api = cls._get_api(api)
         data["macLookup"] = {}
         data["idLookup"] = {}
         for model_type in ModelType.bootstrap_models():
@@ -217,7 +224,7 @@ class Bootstrap(ProtectBaseObject):
                     data["macLookup"][cleaned_mac] = ref
             data[key] = items
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -9,7 +9,7 @@ from functools import cache
 from ipaddress import IPv4Address
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Optional, Union, cast
 import warnings
 
 from pydantic.v1.fields import PrivateAttr
@@ -78,6 +78,7 @@ from pyunifiprotect.utils import (
 )
 
 if TYPE_CHECKING:
+    from pyunifiprotect.api import ProtectApiClient
     from pyunifiprotect.data.nvr import Event, Liveview
 
 PRIVACY_ZONE_NAME = "pyufp_privacy_zone"
@@ -107,11 +108,15 @@ class LightDeviceSettings(ProtectBaseObject):
     pir_sensitivity: PercentInt
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "pirDuration" in data and not isinstance(data["pirDuration"], timedelta):
             data["pirDuration"] = timedelta(milliseconds=data["pirDuration"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class LightOnSettings(ProtectBaseObject):
@@ -338,17 +343,7 @@ class ISPSettings(ProtectBaseObject):
     icr_switch_mode: Optional[str] = None
     spotlight_duration: Optional[int] = None
 
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if "focusMode" in data and data["focusMode"] is None:
-            del data["focusMode"]
-
-        return data
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("focusMode",)
 
 
 class OSDSettings(ProtectBaseObject):
@@ -404,7 +399,11 @@ class RecordingSettings(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "prePaddingSecs" in data:
             data["prePadding"] = timedelta(seconds=data.pop("prePaddingSecs"))
         if "postPaddingSecs" in data:
@@ -430,7 +429,7 @@ class RecordingSettings(ProtectBaseObject):
         ):
             data["endMotionEventDelay"] = timedelta(seconds=data["endMotionEventDelay"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -472,7 +471,11 @@ class SmartDetectSettings(ProtectBaseObject):
     auto_tracking_object_types: Optional[list[SmartDetectObjectType]] = None
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "objectTypes" in data:
             data["objectTypes"] = convert_smart_types(data.pop("objectTypes"))
         if "audioTypes" in data:
@@ -482,7 +485,7 @@ class SmartDetectSettings(ProtectBaseObject):
                 data.pop("autoTrackingObjectTypes"),
             )
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class LCDMessage(ProtectBaseObject):
@@ -491,7 +494,11 @@ class LCDMessage(ProtectBaseObject):
     reset_at: Optional[datetime] = None
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "resetAt" in data:
             data["resetAt"] = process_datetime(data, "resetAt")
         if "text" in data:
@@ -501,7 +508,7 @@ class LCDMessage(ProtectBaseObject):
 
             data["text"] = cls._fix_text(data["text"], data["type"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     @classmethod
     def _fix_text(cls, text: str, text_type: Optional[str]) -> str:
@@ -576,7 +583,11 @@ class VideoStats(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "recordingStart" in data:
             data["recordingStart"] = process_datetime(data, "recordingStart")
         if "recordingEnd" in data:
@@ -594,13 +605,15 @@ class VideoStats(ProtectBaseObject):
         if "timelapseEndLQ" in data:
             data["timelapseEndLQ"] = process_datetime(data, "timelapseEndLQ")
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class StorageStats(ProtectBaseObject):
     used: Optional[int]  # bytes
     rate: Optional[float]  # bytes / millisecond
 
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("rate",)
+
     @property
     def rate_per_second(self) -> Optional[float]:
         if self.rate is None:
@@ -609,23 +622,15 @@ class StorageStats(ProtectBaseObject):
         return self.rate * 1000
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "rate" not in data:
             data["rate"] = None
 
-        return super().unifi_dict_to_dict(data)
-
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if "rate" in data and data["rate"] is None:
-            del data["rate"]
-
-        return data
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class CameraStats(ProtectBaseObject):
@@ -638,11 +643,15 @@ class CameraStats(ProtectBaseObject):
     wifi_strength: int
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "storage" in data and data["storage"] == {}:
             del data["storage"]
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -664,8 +673,12 @@ class CameraZone(ProtectBaseObject):
     points: list[tuple[Percent, Percent]]
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
-        data = super().unifi_dict_to_dict(data)
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
+        data = super().unifi_dict_to_dict(data, api=api)
         if "points" in data and isinstance(data["points"], Iterable):
             data["points"] = [(p[0], p[1]) for p in data["points"]]
 
@@ -701,11 +714,15 @@ class SmartMotionZone(MotionZone):
     object_types: list[SmartDetectObjectType]
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "objectTypes" in data:
             data["objectTypes"] = convert_smart_types(data.pop("objectTypes"))
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class PrivacyMaskCapability(ProtectBaseObject):
@@ -858,7 +875,11 @@ class CameraFeatureFlags(ProtectBaseObject):
     zoom: PTZZoomRange
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "smartDetectTypes" in data:
             data["smartDetectTypes"] = convert_smart_types(data.pop("smartDetectTypes"))
         if "smartDetectAudioTypes" in data:
@@ -872,7 +893,7 @@ class CameraFeatureFlags(ProtectBaseObject):
         if "hasChime" in data and "isDoorbell" not in data:
             data["isDoorbell"] = data["hasChime"]
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     @classmethod
     @cache
@@ -1033,14 +1054,18 @@ class Camera(ProtectMotionDeviceModel):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         # LCD messages comes back as empty dict {}
         if "lcdMessage" in data and len(data["lcdMessage"].keys()) == 0:
             del data["lcdMessage"]
         if "chimeDuration" in data and not isinstance(data["chimeDuration"], timedelta):
             data["chimeDuration"] = timedelta(milliseconds=data["chimeDuration"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -3246,14 +3271,18 @@ class Doorlock(ProtectAdoptableDeviceModel):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "autoCloseTimeMs" in data and not isinstance(
             data["autoCloseTimeMs"],
             timedelta,
         ):
             data["autoCloseTimeMs"] = timedelta(milliseconds=data["autoCloseTimeMs"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     @property
     def camera(self) -> Optional[Camera]:
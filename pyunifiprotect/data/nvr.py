@@ -61,11 +61,12 @@ from pyunifiprotect.utils import RELEASE_CACHE, process_datetime
 if TYPE_CHECKING:
     from pydantic.v1.typing import SetStr
 
+    from pyunifiprotect.api import ProtectApiClient
+
 
 _LOGGER = logging.getLogger(__name__)
 MAX_SUPPORTED_CAMERAS = 256
 MAX_EVENT_HISTORY_IN_STATE_MACHINE = MAX_SUPPORTED_CAMERAS * 2
-DELETE_KEYS_THUMB = {"color", "vehicleType"}
 DELETE_KEYS_EVENT = {"deletedAt", "category", "subCategory"}
 
 
@@ -93,11 +94,15 @@ class SmartDetectItem(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "duration" in data:
             data["duration"] = timedelta(milliseconds=data["duration"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class SmartDetectTrack(ProtectBaseObject):
@@ -138,18 +143,7 @@ class EventThumbnailAttributes(ProtectBaseObject):
     color: Optional[EventThumbnailAttribute] = None
     vehicle_type: Optional[EventThumbnailAttribute] = None
 
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        for key in DELETE_KEYS_THUMB.intersection(data.keys()):
-            if data[key] is None:
-                del data[key]
-
-        return data
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("color", "vehicleType")
 
 
 class EventDetectedThumbnail(ProtectBaseObject):
@@ -159,27 +153,21 @@ class EventDetectedThumbnail(ProtectBaseObject):
     attributes: Optional[EventThumbnailAttributes] = None
     name: Optional[str]
 
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("name",)
+
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "clockBestWall" in data:
             if data["clockBestWall"]:
                 data["clockBestWall"] = process_datetime(data, "clockBestWall")
             else:
                 del data["clockBestWall"]
 
-        return super().unifi_dict_to_dict(data)
-
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if "name" in data and data["name"] is None:
-            del data["name"]
-
-        return data
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class EventMetadata(ProtectBaseObject):
@@ -232,12 +220,16 @@ class EventMetadata(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         for key in cls._collapse_keys.intersection(data.keys()):
             if isinstance(data[key], dict):
                 data[key] = data[key]["text"]
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -300,11 +292,15 @@ class Event(ProtectModelWithId):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         for key in {"start", "end", "timestamp", "deletedAt"}.intersection(data.keys()):
             data[key] = process_datetime(data, key)
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -560,7 +556,11 @@ class StorageInfo(ProtectBaseObject):
     capability: Optional[str] = None
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "type" in data:
             storage_type = data.pop("type")
             try:
@@ -569,7 +569,7 @@ class StorageInfo(ProtectBaseObject):
                 _LOGGER.warning("Unknown storage type: %s", storage_type)
                 data["type"] = StorageType.UNKNOWN
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class StorageSpace(ProtectBaseObject):
@@ -620,11 +620,15 @@ class UOSDisk(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "estimate" in data and data["estimate"] is not None:
             data["estimate"] = timedelta(seconds=data.pop("estimate"))
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -704,11 +708,15 @@ class UOSSpace(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "estimate" in data and data["estimate"] is not None:
             data["estimate"] = timedelta(seconds=data.pop("estimate"))
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(
         self,
@@ -739,17 +747,7 @@ class SystemInfo(ProtectBaseObject):
     tmpfs: TMPFSInfo
     ustorage: Optional[UOSStorage] = None
 
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if data is not None and "ustorage" in data and data["ustorage"] is None:
-            del data["ustorage"]
-
-        return data
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("ustorage",)
 
 
 class DoorbellMessage(ProtectBaseObject):
@@ -772,13 +770,17 @@ class DoorbellSettings(ProtectBaseObject):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "defaultMessageResetTimeoutMs" in data:
             data["defaultMessageResetTimeout"] = timedelta(
                 milliseconds=data.pop("defaultMessageResetTimeoutMs"),
             )
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class RecordingTypeDistribution(ProtectBaseObject):
@@ -866,7 +868,11 @@ class StorageStats(ProtectBaseObject):
     storage_distribution: StorageDistribution
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "capacity" in data and data["capacity"] is not None:
             data["capacity"] = timedelta(milliseconds=data.pop("capacity"))
         if "remainingCapacity" in data and data["remainingCapacity"] is not None:
@@ -874,7 +880,7 @@ class StorageStats(ProtectBaseObject):
                 milliseconds=data.pop("remainingCapacity"),
             )
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class NVRFeatureFlags(ProtectBaseObject):
@@ -1019,7 +1025,11 @@ class NVR(ProtectDeviceModel):
         }
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "lastUpdateAt" in data:
             data["lastUpdateAt"] = process_datetime(data, "lastUpdateAt")
         if "lastDeviceFwUpdatesCheckedAt" in data:
@@ -1037,7 +1047,7 @@ class NVR(ProtectDeviceModel):
         if "timezone" in data and not isinstance(data["timezone"], tzinfo):
             data["timezone"] = zoneinfo.ZoneInfo(data["timezone"])
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     async def _api_update(self, data: dict[str, Any]) -> None:
         return await self.api.update_nvr(data)
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from datetime import datetime
 from functools import cache
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 from pydantic.v1.fields import PrivateAttr
 
 from pyunifiprotect.data.base import ProtectBaseObject, ProtectModel, ProtectModelWithId
 from pyunifiprotect.data.types import ModelType, PermissionNode
 
+if TYPE_CHECKING:
+    from pyunifiprotect.api import ProtectApiClient
+
 
 class Permission(ProtectBaseObject):
     raw_permission: str
@@ -19,7 +22,11 @@ class Permission(ProtectBaseObject):
     obj_ids: Optional[set[str]]
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         permission = data.get("rawPermission", "")
         parts = permission.split(":")
         if len(parts) < 2:
@@ -37,7 +44,7 @@ class Permission(ProtectBaseObject):
             else:
                 data["obj_ids"] = parts[2].split(",")
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     def unifi_dict(  # type: ignore[override]
         self,
@@ -62,12 +69,16 @@ class Group(ProtectModelWithId):
     is_default: bool
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "permissions" in data:
             permissions = data.pop("permissions")
             data["permissions"] = [{"rawPermission": p} for p in permissions]
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
 
 class UserLocation(ProtectModel):
@@ -85,6 +96,8 @@ class CloudAccount(ProtectModelWithId):
     location: Optional[UserLocation]
     profile_img: Optional[str] = None
 
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("location",)
+
     @classmethod
     @cache
     def _get_unifi_remaps(cls) -> dict[str, str]:
@@ -100,8 +113,6 @@ class CloudAccount(ProtectModelWithId):
         # id and cloud ID are always the same
         if "id" in data:
             data["cloudId"] = data["id"]
-        if "location" in data and data["location"] is None:
-            del data["location"]
 
         return data
 
@@ -133,6 +144,8 @@ class User(ProtectModelWithId):
     cloud_account: Optional[CloudAccount]
     feature_flags: UserFeatureFlags
 
+    _prune_if_none: ClassVar[tuple[str, ...]] = ("location",)
+
     # TODO:
     # settings
     # alertRules
@@ -158,7 +171,11 @@ class User(ProtectModelWithId):
         super().__init__(**data)
 
     @classmethod
-    def unifi_dict_to_dict(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def unifi_dict_to_dict(
+        cls,
+        data: dict[str, Any],
+        api: Optional[ProtectApiClient] = None,
+    ) -> dict[str, Any]:
         if "permissions" in data:
             permissions = data.pop("permissions")
             data["permissions"] = [{"rawPermission": p} for p in permissions]
@@ -166,25 +183,13 @@ class User(ProtectModelWithId):
             permissions = data.pop("allPermissions")
             data["allPermissions"] = [{"rawPermission": p} for p in permissions]
 
-        return super().unifi_dict_to_dict(data)
+        return super().unifi_dict_to_dict(data, api=api)
 
     @classmethod
     @cache
     def _get_unifi_remaps(cls) -> dict[str, str]:
         return {**super()._get_unifi_remaps(), "groups": "groupIds"}
 
-    def unifi_dict(
-        self,
-        data: Optional[dict[str, Any]] = None,
-        exclude: Optional[set[str]] = None,
-    ) -> dict[str, Any]:
-        data = super().unifi_dict(data=data, exclude=exclude)
-
-        if "location" in data and data["location"] is None:
-            del data["location"]
-
-        return data
-
     @property
     def groups(self) -> list[Group]:
         """Groups the user is in
@@ -63,10 +63,14 @@ SNAKE_CASE_KEYS = [
     "space_type",
 ]
 TIMEZONE_GLOBAL: tzinfo | None = None
+# resolved once, kept in sync with the ENV variable by `set_debug`/`set_no_debug`
+_DEBUG = os.environ.get(DEBUG_ENV) == str(True)
 
-SNAKE_CASE_MATCH_1 = re.compile("(.)([A-Z0-9][a-z]+)")
-SNAKE_CASE_MATCH_2 = re.compile("__([A-Z0-9])")
-SNAKE_CASE_MATCH_3 = re.compile("([a-z0-9])([A-Z])")
+# replaced with "_": a double underscore before a word ("a__B"), or word boundaries
+# before a capitalized word ("getHTTP|Response") or after a lowercase letter/digit ("get|HTTP")
+SNAKE_CASE_BOUNDARY = re.compile(
+    r"__(?=[A-Z0-9])|(?<=[^_])(?=[A-Z0-9][a-z])|(?<=[a-z0-9])(?=[A-Z])",
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,17 +98,23 @@ else:
 
 def set_debug() -> None:
     """Sets ENV variable for UFP_DEBUG to on (True)"""
+    global _DEBUG  # noqa: PLW0603
+
     os.environ[DEBUG_ENV] = str(True)
+    _DEBUG = True
 
 
 def set_no_debug() -> None:
     """Sets ENV variable for UFP_DEBUG to off (False)"""
+    global _DEBUG  # noqa: PLW0603
+
     os.environ[DEBUG_ENV] = str(False)
+    _DEBUG = False
 
 
 def is_debug() -> bool:
-    """Returns if debug ENV is on (True)"""
-    return os.environ.get(DEBUG_ENV) == str(True)
+    """Returns if debug is on (True)"""
+    return _DEBUG
 
 
 async def get_response_reason(response: ClientResponse) -> str:
@@ -188,15 +198,13 @@ def is_doorbell(data: dict[str, Any]) -> bool:
     return "doorbell" in str(data["type"]).lower()
 
 
-@lru_cache(maxsize=1024)
+@lru_cache(maxsize=4096)
 def to_snake_case(name: str) -> str:
     """Converts string to snake_case"""
-    name = SNAKE_CASE_MATCH_1.sub(r"\1_\2", name)
-    name = SNAKE_CASE_MATCH_2.sub(r"_\1", name)
-    name = SNAKE_CASE_MATCH_3.sub(r"\1_\2", name)
-    return name.lower()
+    return SNAKE_CASE_BOUNDARY.sub("_", name).lower()
 
 
+@lru_cache(maxsize=4096)
 def to_camel_case(name: str) -> str:
     """Converts string to camelCase"""
     # repeated runs through should not keep lowercasing
@@ -206,6 +214,25 @@ def to_camel_case(name: str) -> str:
     return name
 
 
+def is_unifi_data_convertible(field: ModelField) -> bool:
+    """Checks if `convert_unifi_data` may change UFP data for pydantic field"""
+
+    type_ = field.type_
+
+    if type_ == Any:
+        return False
+    # containers are always rebuilt so the model never shares them with the UFP data
+    if field.shape in {SHAPE_LIST, SHAPE_SET, SHAPE_DICT}:
+        return True
+
+    return (
+        type_ in IP_TYPES
+        or type_ == datetime
+        or type_ in _CREATE_TYPES
+        or (isclass(type_) and issubclass(type_, Enum))
+    )
+
+
 def convert_unifi_data(value: Any, field: ModelField) -> Any:
     """Converts value from UFP data into pydantic field class"""
 
@@ -268,13 +295,14 @@ def serialize_unifi_obj(value: Any, levels: int = -1) -> Any:
 
 def serialize_dict(data: dict[str, Any], levels: int = -1) -> dict[str, Any]:
     """Serializes UFP data dict"""
-    for key in list(data.keys()):
+    serialized: dict[str, Any] = {}
+    for key, value in data.items():
         set_key = key
         if set_key not in SNAKE_CASE_KEYS:
             set_key = to_camel_case(set_key)
-        data[set_key] = serialize_unifi_obj(data.pop(key), levels=levels)
+        serialized[set_key] = serialize_unifi_obj(value, levels=levels)
 
-    return data
+    return serialized
 
 
 def serialize_coord(coord: CoordType) -> Union[int, float]:
@@ -10,6 +10,7 @@ from ipaddress import IPv4Address
 from typing import TYPE_CHECKING, Any, Optional, cast
 from unittest.mock import Mock, patch
 
+from pydantic.v1 import ValidationError
 import pytest
 
 from pyunifiprotect.data import (
@@ -29,6 +30,7 @@ from pyunifiprotect.data import (
     WSPacket,
     create_from_unifi_dict,
 )
+from pyunifiprotect.data.base import ProtectBaseObject
 from pyunifiprotect.data.devices import LCDMessage
 from pyunifiprotect.data.types import RecordingType, ResolutionStorageType
 from pyunifiprotect.exceptions import BadRequest, NotAuthorized, StreamError
@@ -370,6 +372,25 @@ def test_bootstrap_device_not_adopted_enabled(
     assert obj.cameras == obj_construct.cameras
 
 
+@pytest.mark.skipif(not TEST_CAMERA_EXISTS, reason="Missing testdata")
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"isDark": "garbage"},
+        {"micVolume": 500},
+        {"wiredConnectionState": {"phyRate": "garbage"}},
+    ],
+)
+def test_update_from_dict_validates_no_debug(camera_obj: Camera, data: dict[str, Any]):
+    # websocket error recovery relies on bad updates raising, even outside debug mode
+    set_no_debug()
+    try:
+        with pytest.raises(ValidationError):
+            camera_obj.update_from_dict(camera_obj.unifi_dict_to_dict(data))
+    finally:
+        set_debug()
+
+
 @pytest.mark.benchmark(group="construct")
 @pytest.mark.timeout(0)
 def test_bootstrap_benchmark(bootstrap: dict[str, Any], benchmark: BenchmarkFixture):
@@ -428,6 +449,26 @@ def test_fix_order_size_dict_negative_max():
     assert d == {"test": 1, "test3": 3}
 
 
+def test_protect_subtypes_disjoint():
+    klasses = list(ProtectBaseObject.__subclasses__())
+    while klasses:
+        klass = klasses.pop()
+        klasses.extend(klass.__subclasses__())
+
+        objs = set(klass._protect_objs)
+        lists = set(klass._protect_lists)
+        dicts = set(klass._protect_dicts)
+        assert not objs & lists, klass
+        assert not objs & dicts, klass
+        assert not lists & dicts, klass
+        assert klass._protect_children_keys == objs | lists | dicts, klass
+
+    assert "channels" in Camera._protect_lists
+    assert "channels" not in Camera._protect_objs
+    assert "cameras" in Bootstrap._protect_dicts
+    assert "cameras" not in Bootstrap._protect_objs
+
+
 def test_case_str_enum():
     assert RecordingMode("always") == RecordingMode.ALWAYS
     assert ResolutionStorageType("4K") == ResolutionStorageType.UHD
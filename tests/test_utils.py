@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import Any
+from datetime import datetime
+from typing import Any, Optional
 from uuid import UUID
 
 from pydantic.v1.config import BaseConfig
 from pydantic.v1.fields import ModelField
 import pytest
 
-from pyunifiprotect.utils import convert_unifi_data, dict_diff, to_snake_case
+from pyunifiprotect.utils import (
+    convert_unifi_data,
+    dict_diff,
+    is_unifi_data_convertible,
+    to_snake_case,
+)
 
 
 def test_dict_diff_equal():
@@ -107,6 +113,15 @@ def test_to_snake_case():
     assert to_snake_case("get2HTTPResponseCode") == "get2_http_response_code"
     assert to_snake_case("HTTPResponseCode") == "http_response_code"
     assert to_snake_case("HTTPResponseCodeXYZ") == "http_response_code_xyz"
+    assert to_snake_case("wiredConnectionState") == "wired_connection_state"
+    assert to_snake_case("isDark") == "is_dark"
+    assert to_snake_case("hdrMode") == "hdr_mode"
+    assert to_snake_case("camera") == "camera"
+    assert to_snake_case("already_snake") == "already_snake"
+    assert to_snake_case("a__B") == "a_b"
+    assert to_snake_case("a__Bc") == "a_bc"
+    assert to_snake_case("a1a1a") == "a_1a_1a"
+    assert to_snake_case("x__1y") == "x_1y"
 
 
 @pytest.mark.parametrize(
@@ -146,3 +161,26 @@ def test_to_snake_case():
 )
 def test_convert_unifi_data(value: Any, field: ModelField, output: Any):
     assert convert_unifi_data(value, field) == output
+
+
+@pytest.mark.parametrize(
+    ("type_", "output"),
+    [
+        (str, False),
+        (Optional[int], False),
+        (Any, False),
+        (UUID, True),
+        (datetime, True),
+        (list[str], True),
+        (set[str], True),
+    ],
+)
+def test_is_unifi_data_convertible(type_: Any, output: bool):
+    field = ModelField.infer(
+        name="test",
+        value=None,
+        annotation=type_,
+        class_validators=None,
+        config=BaseConfig,
+    )
+    assert is_unifi_data_convertible(field) is output